@@ -50,7 +50,10 @@ def main():
     num_classes = ds_info.features["label"].num_classes
 
     train_ds = (
-        train_ds.map(lambda x, y: resize(x, num_classes=num_classes))
+        train_ds.map(
+            lambda x, y: resize(x, num_classes=num_classes),
+            num_parallel_calls=tf.data.AUTOTUNE,
+        )
         .shuffle(10 * BATCH_SIZE)
         .batch(BATCH_SIZE)
     )
@@ -58,6 +61,13 @@ def main():
     custom_pipeline = create_custom_pipeline()
 
     train_ds = train_ds.map(custom_pipeline, num_parallel_calls=tf.data.AUTOTUNE)
+    train_ds = train_ds.prefetch(tf.data.AUTOTUNE)
+
+    # The order of augmented batches does not matter, so let the parallel maps
+    # yield elements as soon as they are ready.
+    options = tf.data.Options()
+    options.deterministic = False
+    train_ds = train_ds.with_options(options)
 
     for images in train_ds.take(1):
         plt.figure(figsize=(8, 8))
@@ -47,68 +47,112 @@ class Equalization(tf.keras.__internal__.layers.BaseImageAugmentationLayer):
         self.bins = bins
         self.value_range = value_range
 
-    def equalize_channel(self, image, channel_index):
-        """equalize_channel performs histogram equalization on a single channel.
+    def equalize(self, images):
+        """equalize performs histogram equalization on every channel of `images`.
+
+        Each channel's values are offset into their own range of bins, so that the
+        histograms, lookup tables and lookups of all channels of all images are
+        each computed with one batched op on the channels-last layout, rather than
+        once per image and channel.
 
         Args:
-            image: int Tensor with pixels in range [0, 255], RGB format,
-                with channels last
-            channel_index: channel to equalize
+            images: int Tensor with pixels in range [0, 255], RGB format,
+                with channels last.  Either a single image or a batch of images.
+
+        Returns:
+            a uint8 Tensor with the same shape as `images`.
         """
-        image = image[..., channel_index]
-        # Compute the histogram of the image channel.
-        histogram = tf.histogram_fixed_width(image, [0, 255], nbins=self.bins)
+        input_shape = tf.shape(images)
+        height, width, num_channels = (
+            input_shape[-3],
+            input_shape[-2],
+            input_shape[-1],
+        )
+        pixels = tf.reshape(images, [-1, height * width, num_channels])
+        num_images = tf.shape(pixels)[0]
+        channel_offsets = tf.range(num_channels) * self.bins
+
+        # Compute the histogram of each channel.  With the default 256 bins every
+        # pixel value is its own bin, otherwise values are binned the same way
+        # `tf.histogram_fixed_width` does over the range [0, 255].  The same
+        # indices are used for the lookup below, so every pixel reads an entry of
+        # its own channel's table and never indexes out of range.
+        bin_indices = pixels
+        if self.bins != 256:
+            bin_indices = tf.clip_by_value(pixels * self.bins // 255, 0, self.bins - 1)
+        bin_indices = tf.reshape(bin_indices + channel_offsets, [num_images, -1])
+        histograms = tf.math.bincount(
+            bin_indices,
+            minlength=num_channels * self.bins,
+            maxlength=num_channels * self.bins,
+            axis=-1,
+        )
+        histograms = tf.reshape(histograms, [num_images, num_channels, self.bins])
 
         # For the purposes of computing the step, filter out the nonzeros.
         # Zeroes are replaced by a big number while calculating min to keep shape
-        # constant across input sizes for compatibility with vectorized_map
-
+        # constant across input sizes.
         big_number = 1410065408
-        histogram_without_zeroes = tf.where(
-            tf.equal(histogram, 0),
+        histograms_without_zeroes = tf.where(
+            tf.equal(histograms, 0),
             big_number,
-            histogram,
+            histograms,
         )
 
-        step = (tf.reduce_sum(histogram) - tf.reduce_min(histogram_without_zeroes)) // (
-            self.bins - 1
+        step = (
+            tf.reduce_sum(histograms, axis=-1, keepdims=True)
+            - tf.reduce_min(histograms_without_zeroes, axis=-1, keepdims=True)
+        ) // (self.bins - 1)
+
+        # Channels with a step of zero are returned unchanged below, so the lookup
+        # tables are built with a step of at least one to avoid dividing by zero.
+        safe_step = tf.maximum(step, 1)
+
+        # Compute the cumulative sum, shifting by step // 2
+        # and then normalization by step.
+        lookup_tables = (tf.cumsum(histograms, axis=-1) + (safe_step // 2)) // safe_step
+        # Shift lookup_tables, prepending with 0.
+        lookup_tables = tf.concat(
+            [tf.zeros_like(lookup_tables[..., :1]), lookup_tables[..., :-1]], axis=-1
         )
-
-        def build_mapping(histogram, step):
-            # Compute the cumulative sum, shifting by step // 2
-            # and then normalization by step.
-            lookup_table = (tf.cumsum(histogram) + (step // 2)) // step
-            # Shift lookup_table, prepending with 0.
-            lookup_table = tf.concat([[0], lookup_table[:-1]], 0)
-            # Clip the counts to be in range.  This is done
-            # in the C code for image.point.
-            return tf.clip_by_value(lookup_table, 0, 255)
-
-        # If step is zero, return the original image.  Otherwise, build
-        # lookup table from the full histogram and step and then index from it.
-        result = tf.cond(
-            tf.equal(step, 0),
-            lambda: image,
-            lambda: tf.gather(build_mapping(histogram, step), image),
+        # Clip the counts to be in range.  This is done
+        # in the C code for image.point.
+        lookup_tables = tf.clip_by_value(lookup_tables, 0, 255)
+
+        # All values are in [0, 255], so the tables are gathered as uint8 to
+        # reduce the memory traffic of the per-pixel lookup.
+        lookup_tables = tf.cast(lookup_tables, tf.uint8)
+        lookup_tables = tf.reshape(lookup_tables, [num_images, -1])
+
+        result = tf.gather(lookup_tables, bin_indices, batch_dims=1)
+
+        # If step is zero, return the original channel.  Otherwise, use the values
+        # looked up in the table built for that channel.  Unlike a `tf.cond`, the
+        # lookup above also runs for zero-step channels, which is why it has to
+        # stay in range for every channel.
+        result = tf.where(
+            tf.reshape(tf.equal(step, 0), [num_images, 1, num_channels]),
+            tf.cast(pixels, tf.uint8),
+            tf.reshape(result, [num_images, -1, num_channels]),
         )
 
-        return result
+        return tf.reshape(result, input_shape)
 
     def augment_image(self, image, transformation=None):
         image = preprocessing.transform_value_range(
             image, self.value_range, (0, 255), dtype=image.dtype
         )
         image = tf.cast(image, tf.int32)
-        image = tf.vectorized_map(
-            lambda channel: self.equalize_channel(image, channel),
-            tf.range(tf.shape(image)[-1]),
-        )
-
-        image = tf.transpose(image, [1, 2, 0])
+        image = self.equalize(image)
         image = tf.cast(image, tf.float32)
         image = preprocessing.transform_value_range(image, (0, 255), self.value_range)
         return image
 
+    def _batch_augment(self, inputs):
+        # Skip the use of vectorized_map or map_fn as the implementation is already
+        # vectorized
+        return self._augment(inputs)
+
     def augment_label(self, label, transformation=None):
         return label
 
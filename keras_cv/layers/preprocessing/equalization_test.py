@@ -17,6 +17,28 @@ from absl.testing import parameterized
 from keras_cv.layers.preprocessing.equalization import Equalization
 
 
+def _reference_equalize(image, bins):
+    """Per-channel equalization, as computed before the layer was vectorized."""
+    channels = []
+    for channel_index in range(image.shape[-1]):
+        channel = image[..., channel_index]
+        histogram = tf.histogram_fixed_width(channel, [0, 255], nbins=bins)
+        histogram_without_zeroes = tf.where(
+            tf.equal(histogram, 0), 1410065408, histogram
+        )
+        step = (tf.reduce_sum(histogram) - tf.reduce_min(histogram_without_zeroes)) // (
+            bins - 1
+        )
+        if step == 0:
+            channels.append(channel)
+            continue
+        lookup_table = (tf.cumsum(histogram) + (step // 2)) // step
+        lookup_table = tf.concat([[0], lookup_table[:-1]], 0)
+        lookup_table = tf.clip_by_value(lookup_table, 0, 255)
+        channels.append(tf.gather(lookup_table, channel))
+    return tf.cast(tf.stack(channels, axis=-1), tf.float32)
+
+
 class EqualizationTest(tf.test.TestCase, parameterized.TestCase):
     def test_return_shapes(self):
         xs = 255 * tf.ones((2, 512, 512, 3), dtype=tf.int32)
@@ -52,3 +74,45 @@ class EqualizationTest(tf.test.TestCase, parameterized.TestCase):
         layer = Equalization(value_range=(lower, upper))
         xs = layer(xs)
         self.assertAllInRange(xs, lower, upper)
+
+    def test_matches_per_channel_reference(self):
+        xs = tf.random.uniform((2, 32, 32, 2), 0, 256, dtype=tf.int32)
+        # A constant channel has a step of zero and must be returned unchanged.
+        xs = tf.concat([xs, 7 * tf.ones((2, 32, 32, 1), dtype=tf.int32)], axis=-1)
+        layer = Equalization(value_range=(0, 255))
+        ys = layer(xs)
+
+        for i in range(2):
+            self.assertAllEqual(ys[i], _reference_equalize(xs[i], 256))
+
+    def test_fewer_bins_with_full_range_pixels(self):
+        bins = 128
+        xs = tf.random.uniform((2, 32, 32, 3), 0, 256, dtype=tf.int32)
+        # A constant channel has a step of zero and must be returned unchanged,
+        # even though its value is larger than the number of bins.
+        xs = tf.concat(
+            [xs[..., :1], 200 * tf.ones_like(xs[..., :1]), xs[..., 2:]], axis=-1
+        )
+        layer = Equalization(value_range=(0, 255), bins=bins)
+        ys = layer(xs)
+
+        self.assertAllInRange(ys, 0, 255)
+        for i in range(2):
+            self.assertAllEqual(
+                ys[i][..., 1:2], _reference_equalize(xs[i][..., 1:2], bins)
+            )
+            for channel_index in (0, 2):
+                x = tf.reshape(xs[i][..., channel_index], [-1])
+                y = tf.reshape(ys[i][..., channel_index], [-1])
+                # Equalization must preserve the order of pixel values, including
+                # for pixels at or above `bins`, and use the whole output range.
+                y = tf.gather(y, tf.argsort(x))
+                self.assertAllGreaterEqual(y[1:] - y[:-1], 0.0)
+                self.assertGreater(tf.reduce_max(y), bins)
+
+    def test_constant_image_with_fewer_bins_is_unchanged(self):
+        xs = 200 * tf.ones((2, 16, 16, 3), dtype=tf.int32)
+        layer = Equalization(value_range=(0, 255), bins=128)
+        xs = layer(xs)
+
+        self.assertAllEqual(xs, 200 * tf.ones((2, 16, 16, 3)))
@@ -43,10 +43,18 @@ class MixUp(tf.keras.__internal__.layers.BaseImageAugmentationLayer):
         self.alpha = alpha
         self.seed = seed
 
-    @staticmethod
-    def _sample_from_beta(alpha, beta, shape):
-        sample_alpha = tf.random.gamma(shape, 1.0, beta=alpha)
-        sample_beta = tf.random.gamma(shape, 1.0, beta=beta)
+    def _sample_from_beta(self, alpha, beta, shape):
+        # Gamma samples are drawn with stateless ops, seeded from the layer's random
+        # generator so that `seed` controls every random draw made by the layer.
+        seeds = self._random_generator.random_uniform(
+            (2, 2), minval=0, maxval=tf.int32.max, dtype=tf.int32
+        )
+        sample_alpha = tf.random.stateless_gamma(
+            shape, seed=seeds[0], alpha=1.0, beta=alpha
+        )
+        sample_beta = tf.random.stateless_gamma(
+            shape, seed=seeds[1], alpha=1.0, beta=beta
+        )
         return sample_alpha / (sample_alpha + sample_beta)
 
     def _batch_augment(self, inputs):
@@ -60,14 +68,12 @@ class MixUp(tf.keras.__internal__.layers.BaseImageAugmentationLayer):
                 '{"images": images, "bounding_boxes": bounding_boxes}'
                 f"Got: inputs = {inputs}"
             )
-        images, lambda_sample, permutation_order = self._mixup(images)
+        images, lambda_sample, shift = self._mixup(images)
         if labels is not None:
-            labels = self._update_labels(labels, lambda_sample, permutation_order)
+            labels = self._update_labels(labels, lambda_sample, shift)
             inputs["labels"] = labels
         if bounding_boxes is not None:
-            bounding_boxes = self._update_bounding_boxes(
-                bounding_boxes, permutation_order
-            )
+            bounding_boxes = self._update_bounding_boxes(bounding_boxes, shift)
             inputs["bounding_boxes"] = bounding_boxes
         inputs["images"] = images
         return inputs
@@ -81,26 +87,33 @@ class MixUp(tf.keras.__internal__.layers.BaseImageAugmentationLayer):
 
     def _mixup(self, images):
         batch_size = tf.shape(images)[0]
-        permutation_order = tf.random.shuffle(tf.range(0, batch_size), seed=self.seed)
+        # Each sample is mixed with the sample `shift` positions away in the batch.
+        # Rolling the batch pairs up distinct samples like a random permutation
+        # would, but is a contiguous copy rather than a gather.
+        shift = self._random_generator.random_uniform(
+            (), minval=1, maxval=tf.maximum(batch_size, 2), dtype=tf.int32
+        )
 
-        lambda_sample = MixUp._sample_from_beta(self.alpha, self.alpha, (batch_size,))
+        lambda_sample = self._sample_from_beta(self.alpha, self.alpha, (batch_size,))
         lambda_sample = tf.reshape(lambda_sample, [-1, 1, 1, 1])
 
-        mixup_images = tf.gather(images, permutation_order)
-        images = lambda_sample * images + (1.0 - lambda_sample) * mixup_images
+        # lambda * a + (1 - lambda) * b is computed as b + lambda * (a - b), which
+        # needs one broadcast multiplication instead of two.
+        mixup_images = tf.roll(images, shift=shift, axis=0)
+        images = mixup_images + lambda_sample * (images - mixup_images)
 
-        return images, tf.squeeze(lambda_sample), permutation_order
+        return images, tf.squeeze(lambda_sample), shift
 
-    def _update_labels(self, labels, lambda_sample, permutation_order):
-        labels_for_mixup = tf.gather(labels, permutation_order)
+    def _update_labels(self, labels, lambda_sample, shift):
+        labels_for_mixup = tf.roll(labels, shift=shift, axis=0)
 
         lambda_sample = tf.reshape(lambda_sample, [-1, 1])
-        labels = lambda_sample * labels + (1.0 - lambda_sample) * labels_for_mixup
+        labels = labels_for_mixup + lambda_sample * (labels - labels_for_mixup)
 
         return labels
 
-    def _update_bounding_boxes(self, bounding_boxes, permutation_order):
-        boxes_for_mixup = tf.gather(bounding_boxes, permutation_order)
+    def _update_bounding_boxes(self, bounding_boxes, shift):
+        boxes_for_mixup = tf.roll(bounding_boxes, shift=shift, axis=0)
         bounding_boxes = tf.concat([bounding_boxes, boxes_for_mixup], axis=1)
 
         return bounding_boxes
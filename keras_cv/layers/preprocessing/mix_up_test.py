@@ -66,6 +66,18 @@ class MixUpTest(tf.test.TestCase):
         self.assertNotAllClose(ys, 1.0)
         self.assertNotAllClose(ys, 0.0)
 
+    def test_mixes_with_other_samples(self):
+        xs = tf.ones((4, 4, 4, 3))
+        ys = tf.one_hot(tf.range(4), 4)
+
+        layer = MixUp()
+        outputs = layer({"images": xs, "labels": ys})
+        ys = outputs["labels"]
+
+        # Every label should be mixed with exactly one other sample's label
+        self.assertAllEqual(tf.math.count_nonzero(ys, axis=-1), [2, 2, 2, 2])
+        self.assertAllGreater(tf.linalg.diag_part(ys), 0.0)
+
     def test_in_tf_function(self):
         xs = tf.cast(
             tf.stack(
@@ -55,22 +55,33 @@ class RandomGaussianBlur(tf.keras.__internal__.layers.BaseImageAugmentationLayer
                     ", got {} ".format(type(self.kernel_size))
                 )
 
+        # The kernel coordinates only depend on the kernel size, so their squares
+        # are computed once here instead of every time a kernel is built.
+        self._x_squared = RandomGaussianBlur._squared_coordinates(self.x)
+        self._y_squared = RandomGaussianBlur._squared_coordinates(self.y)
+
     def get_random_transformation(self, image=None, label=None, bounding_box=None):
+        # `tf.nn.depthwise_conv2d` requires one filter per channel, so the kernels
+        # are tiled here rather than on every call to `augment_image()`.
+        num_channels = tf.shape(image)[-1]
         factor = self.factor()
-        blur_v = RandomGaussianBlur.get_kernel(factor, self.y)
-        blur_h = RandomGaussianBlur.get_kernel(factor, self.x)
+        blur_v = RandomGaussianBlur._get_kernel_from_squared_coordinates(
+            factor, self._y_squared
+        )
+        blur_h = RandomGaussianBlur._get_kernel_from_squared_coordinates(
+            factor, self._x_squared
+        )
         blur_v = tf.reshape(blur_v, [self.y, 1, 1, 1])
         blur_h = tf.reshape(blur_h, [1, self.x, 1, 1])
+        blur_v = tf.tile(blur_v, [1, 1, num_channels, 1])
+        blur_h = tf.tile(blur_h, [1, 1, num_channels, 1])
         return (blur_v, blur_h)
 
     def augment_image(self, image, transformation=None):
 
         image = tf.expand_dims(image, axis=0)
 
-        num_channels = tf.shape(image)[-1]
         blur_v, blur_h = transformation
-        blur_h = tf.tile(blur_h, [1, 1, num_channels, 1])
-        blur_v = tf.tile(blur_v, [1, 1, num_channels, 1])
         blurred = tf.nn.depthwise_conv2d(
             image, blur_h, strides=[1, 1, 1, 1], padding="SAME"
         )
@@ -80,6 +91,59 @@ class RandomGaussianBlur(tf.keras.__internal__.layers.BaseImageAugmentationLayer
 
         return tf.squeeze(blurred, axis=0)
 
+    def _batch_augment(self, inputs):
+        images = inputs["images"]
+
+        # Every image is blurred with its own factor.
+        factors = self.factor(shape=(tf.shape(images)[0],))
+        blur_v = RandomGaussianBlur._get_kernel_from_squared_coordinates(
+            factors, self._y_squared
+        )
+        blur_h = RandomGaussianBlur._get_kernel_from_squared_coordinates(
+            factors, self._x_squared
+        )
+
+        blurred = self._depthwise_blur(images, blur_v, blur_h)
+
+        # Restore the static shape lost by the reshapes in the blur.
+        inputs["images"] = tf.ensure_shape(blurred, images.shape)
+        return inputs
+
+    def _depthwise_blur(self, images, blur_v, blur_h):
+        input_shape = tf.shape(images)
+        batch_size, height, width, num_channels = (
+            input_shape[0],
+            input_shape[1],
+            input_shape[2],
+            input_shape[3],
+        )
+
+        # To blur every image with its own kernel in a single convolution, the
+        # batch is packed into the channel dimension and each image's kernel is
+        # repeated across its channels.
+        blur_v = tf.tile(tf.transpose(blur_v)[..., None], [1, 1, num_channels])
+        blur_h = tf.tile(tf.transpose(blur_h)[..., None], [1, 1, num_channels])
+        blur_v = tf.reshape(blur_v, [self.y, 1, batch_size * num_channels, 1])
+        blur_h = tf.reshape(blur_h, [1, self.x, batch_size * num_channels, 1])
+
+        packed = tf.transpose(images, [1, 2, 0, 3])
+        packed = tf.reshape(packed, [1, height, width, batch_size * num_channels])
+        blurred = tf.nn.depthwise_conv2d(
+            packed, blur_h, strides=[1, 1, 1, 1], padding="SAME"
+        )
+        blurred = tf.nn.depthwise_conv2d(
+            blurred, blur_v, strides=[1, 1, 1, 1], padding="SAME"
+        )
+        blurred = tf.reshape(blurred, [height, width, batch_size, num_channels])
+
+        return tf.transpose(blurred, [2, 0, 1, 3])
+
+    @staticmethod
+    def _squared_coordinates(filter_size):
+        return [
+            float(x**2) for x in range(-filter_size // 2 + 1, filter_size // 2 + 1)
+        ]
+
     @staticmethod
     def get_kernel(factor, filter_size):
         x = tf.cast(
@@ -91,6 +155,16 @@ class RandomGaussianBlur(tf.keras.__internal__.layers.BaseImageAugmentationLayer
         blur_filter /= tf.reduce_sum(blur_filter)
         return blur_filter
 
+    @staticmethod
+    def _get_kernel_from_squared_coordinates(factor, squared_coordinates):
+        squared_coordinates = tf.constant(squared_coordinates, dtype=tf.float32)
+        # `factor` may be a scalar or a batch of factors, in which case one kernel
+        # is returned per factor.
+        factor = tf.expand_dims(tf.cast(factor, dtype=tf.float32), axis=-1)
+        blur_filter = tf.exp(-squared_coordinates / (2.0 * factor * factor))
+        blur_filter /= tf.reduce_sum(blur_filter, axis=-1, keepdims=True)
+        return blur_filter
+
     def get_config(self):
         config = super().get_config()
         config.update({"factor": self.factor, "kernel_size": self.kernel_size})
@@ -104,3 +104,19 @@ class RandomGaussianBlurTest(tf.test.TestCase):
         xs = layer(xs)
 
         self.assertAllClose(xs, result)
+
+    def test_batched_and_single_image_results_match(self):
+        layer = preprocessing.RandomGaussianBlur(kernel_size=(3, 5), factor=(1.5, 1.5))
+
+        xs = tf.random.uniform((4, 32, 48, 3))
+        batched = layer(xs)
+
+        for i in range(4):
+            self.assertAllClose(batched[i], layer(xs[i]))
+
+    def test_get_kernel(self):
+        kernel = preprocessing.RandomGaussianBlur.get_kernel(1.0, 5)
+
+        self.assertEqual(kernel.shape, [5])
+        self.assertAllClose(tf.reduce_sum(kernel), 1.0)
+        self.assertAllClose(kernel, tf.reverse(kernel, axis=[0]))
@@ -202,18 +202,18 @@ class COCORecall(keras.metrics.Metric):
             tf.cast(present_values, tf.int32), axis=-1
         )
         n_present_categories = tf.cast(n_present_categories, self.dtype)
-
-        if n_present_categories == 0.0:
-            return 0.0
+        num_thresholds = tf.cast(len(self.iou_thresholds), self.dtype)
 
         true_positives = tf.cast(self.true_positives, self.dtype)
         ground_truth_boxes = tf.cast(self.ground_truth_boxes, self.dtype)
 
+        # The mean over thresholds of the per-threshold recall averaged over the
+        # present categories is computed as a single sum over both axes.
+        # `divide_no_nan` returns 0.0 when no categories are present.
         recalls = tf.math.divide_no_nan(true_positives, ground_truth_boxes[None, :])
-        recalls_per_threshold = (
-            tf.math.reduce_sum(recalls, axis=-1) / n_present_categories
+        return tf.math.divide_no_nan(
+            tf.math.reduce_sum(recalls), n_present_categories * num_thresholds
         )
-        return tf.math.reduce_mean(recalls_per_threshold)
 
     def get_config(self):
         config = super().get_config()